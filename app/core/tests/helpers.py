@@ -0,0 +1,15 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+User = get_user_model()
+
+SAMPLE_PASSWORD = 'somethingrandom'
+SAMPLE_PASSWORD_HASH = make_password(SAMPLE_PASSWORD)
+
+
+def sample_user(email='test@recipeapi.com'):
+    """Creates a sample user for tests with a precomputed password hash"""
+    user = User(email=email, password=SAMPLE_PASSWORD_HASH)
+    user.save(force_insert=True)
+
+    return user
@@ -6,19 +6,23 @@ from django.urls import reverse
 
 class AdminSiteTests(TestCase):
 
-    def setUp(self) -> None:
-        """Setup function for AdminSiteTests"""
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup class level data for AdminSiteTests"""
+        cls.admin_user = get_user_model().objects.create_superuser(
             email="admin@recipeapi.com",
             password="somethingrandom"
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email="user@recipeapi.com",
             password="somethingrandom"
         )
 
+    def setUp(self) -> None:
+        """Setup function for AdminSiteTests"""
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_user_listed(self):
         """Tests that users are listed on user list page"""
         url = reverse("admin:core_user_changelist")
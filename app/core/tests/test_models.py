@@ -5,11 +5,7 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 
 from .. import models
-
-
-def sample_user(email='test@recipeapi.com', password='somethingrandom'):
-    """Creates a sample user for tests"""
-    return get_user_model().objects.create_user(email=email, password=password)
+from .helpers import sample_user
 
 
 class UserModelTests(TestCase):
@@ -60,42 +56,32 @@ class UserModelTests(TestCase):
         self.assertTrue(user.is_superuser)
 
 
-class TagModelTests(TestCase):
-
-    def test_tag_str(self):
-        """Test that tag object returns a string representation"""
-        tag = models.Tag.objects.create(
-            name='test tag',
-            user=sample_user()
-        )
-
-        self.assertEqual(str(tag), tag.name)
-
+class ModelStrTests(TestCase):
 
-class IngredientModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user()
 
-    def test_ingredient_str(self):
-        """Test that ingredient object returns a string representation"""
-        ingredient = models.Ingredient.objects.create(
-            name='test ingredient',
-            user=sample_user()
+    def test_model_str(self):
+        """Test that model objects return a string representation"""
+        cases = (
+            (models.Tag, {'name': 'test tag'}, 'name'),
+            (models.Ingredient, {'name': 'test ingredient'}, 'name'),
+            (models.Recipe, {
+                'title': 'Pizza',
+                'time_minutes': 5,
+                'price': 5.00
+            }, 'title'),
         )
 
-        self.assertEqual(str(ingredient), ingredient.name)
+        for model, params, str_field in cases:
+            with self.subTest(model=model.__name__):
+                obj = model.objects.create(user=self.user, **params)
 
+                self.assertEqual(str(obj), getattr(obj, str_field))
 
-class RecipeModelTests(TestCase):
 
-    def test_recipe_str(self):
-        """Test that recipe object returns a string representation"""
-        recipe = models.Recipe.objects.create(
-            user=sample_user(),
-            title='Pizza',
-            time_minutes=5,
-            price=5.00
-        )
-
-        self.assertEqual(str(recipe), recipe.title)
+class RecipeModelTests(TestCase):
 
     @patch('uuid.uuid4', return_value='test_uuid')
     def test_recipe_filename_uuid(self, mock_uuid):
@@ -1,8 +1,27 @@
+from django.db.models import QuerySet
+
 from rest_framework import serializers
 
 from core.models import Tag, Ingredient, Recipe
 
 
+class ValuesListSerializer(serializers.ListSerializer):
+    """List serializer that reads plain field values from querysets
+
+    Querysets are serialized with values(*Meta.fields), bypassing the child
+    serializer's fields. Only use it for serializers whose Meta.fields are
+    all plain model columns output unchanged: method fields, source
+    renames or custom to_representation logic would not be applied.
+    """
+
+    def to_representation(self, data):
+        """Return queryset rows as dicts without building model instances"""
+        if isinstance(data, QuerySet):
+            return list(data.values(*self.child.Meta.fields))
+
+        return super().to_representation(data)
+
+
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for tag model"""
 
@@ -10,6 +29,7 @@ class TagSerializer(serializers.ModelSerializer):
         model = Tag
         fields = ('id', 'name')
         read_only_fields = ('id',)
+        list_serializer_class = ValuesListSerializer
 
 
 class IngredientSerializer(serializers.ModelSerializer):
@@ -19,6 +39,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         model = Ingredient
         fields = ('id', 'name')
         read_only_fields = ('id',)
+        list_serializer_class = ValuesListSerializer
 
 
 class RecipeSerializer(serializers.ModelSerializer):
@@ -44,6 +65,35 @@ class RecipeDetailSerializer(RecipeSerializer):
     ingredients = IngredientSerializer(many=True, read_only=True)
     tags = TagSerializer(many=True, read_only=True)
 
+    def to_representation(self, instance):
+        """Build the representation without per-item nested serialization
+
+        Nested tags and ingredients are read as plain attributes named by
+        their child serializer's Meta.fields, the same plain-column
+        constraint as ValuesListSerializer. Every other field in
+        Meta.fields goes through its declared field.
+        """
+        ret = {}
+
+        for name in self.Meta.fields:
+            field = self.fields[name]
+
+            if isinstance(field, serializers.ListSerializer):
+                child_fields = field.child.Meta.fields
+                ret[name] = [
+                    {key: getattr(obj, key) for key in child_fields}
+                    for obj in getattr(instance, name).all()
+                ]
+                continue
+
+            value = field.get_attribute(instance)
+            if value is not None:
+                value = field.to_representation(value)
+
+            ret[name] = value
+
+        return ret
+
 
 class RecipeImageSerializer(serializers.ModelSerializer):
     """Serializer for uploading images to recipes"""
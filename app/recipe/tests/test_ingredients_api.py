@@ -1,28 +1,19 @@
-from django.test import TestCase
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase, APISimpleTestCase
 
 from core.models import Ingredient, Recipe
+from core.tests.helpers import sample_user
 
 from ..serializers import IngredientSerializer
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
 
-def sample_user(email='test@recipeapi.com', password='somethingrandom'):
-    """Creates a sample user for tests"""
-    return get_user_model().objects.create_user(email, password)
-
-
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(APISimpleTestCase):
     """Test the public ingredients api"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-
     def test_login_required(self):
         """Test that login is required for access"""
         res = self.client.get(INGREDIENTS_URL)
@@ -30,34 +21,36 @@ class PublicIngredientsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateIngredientsApiTests(TestCase):
+class PrivateIngredientsApiTests(APITestCase):
     """Test the private ingredients api"""
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user()
+
     def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = sample_user()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_ingredients(self):
         """Test retrieving a list of ingredients"""
-        Ingredient.objects.create(user=self.user, name='Kale')
-        Ingredient.objects.create(user=self.user, name='Salt')
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name='Kale'),
+            Ingredient(user=self.user, name='Salt')
+        ])
 
         ingredients = Ingredient.objects.all().order_by('-name')
 
         serializer = IngredientSerializer(ingredients, many=True)
 
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
     def test_ingredients_limited_valid_user(self):
         """Test that only ingredients for authenticated users are returned"""
-        user_test = sample_user(
-            email='test2@recipeapi.com',
-            password='somethingrandom2'
-        )
+        user_test = sample_user(email='test2@recipeapi.com')
 
         Ingredient.objects.create(user=user_test, name='ingredient test')
         ingredient = Ingredient.objects.create(
@@ -77,12 +70,8 @@ class PrivateIngredientsApiTests(TestCase):
 
         res = self.client.post(INGREDIENTS_URL, payload)
 
-        exists = Ingredient.objects.filter(
-            name=payload['name']
-        ).exists()
-
-        self.assertTrue(exists)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertIn('id', res.data)
         self.assertEqual(payload['name'], res.data['name'])
 
     def test_craete_ingredient_invalid(self):
@@ -91,12 +80,8 @@ class PrivateIngredientsApiTests(TestCase):
 
         res = self.client.post(INGREDIENTS_URL, payload)
 
-        exists = Ingredient.objects.filter(
-            user=self.user
-        ).exists()
-
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertFalse(exists)
+        self.assertFalse(Ingredient.objects.exists())
 
     def test_retrieving_ingredients_assigned_to_recipes(self):
         """Test filtering ingredients assigned to recipes"""
@@ -118,10 +103,11 @@ class PrivateIngredientsApiTests(TestCase):
 
         recipe.ingredients.add(ing_2)
 
-        res = self.client.get(
-            INGREDIENTS_URL,
-            {'assigned_only': 1}
-        )
+        with self.assertNumQueries(1):
+            res = self.client.get(
+                INGREDIENTS_URL,
+                {'assigned_only': 1}
+            )
 
         serializer_1 = IngredientSerializer(ing_1)
         serializer_2 = IngredientSerializer(ing_2)
@@ -1,36 +1,41 @@
-import tempfile
+import io
 import os
 
 from PIL import Image
 
-from django.test import TestCase
-from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase, APISimpleTestCase
 
 from core.models import Tag, Ingredient, Recipe
-from ..serializers import RecipeSerializer, RecipeDetailSerializer
+from core.tests.helpers import sample_user
+from ..serializers import RecipeSerializer
 
 RECIPES_URL = reverse('recipe:recipe-list')
+RECIPE_DETAIL_URL = reverse(
+    'recipe:recipe-detail', args=[0]
+).replace('/0/', '/{}/')
+RECIPE_UPLOAD_IMAGE_URL = reverse(
+    'recipe:recipe-upload-image', args=[0]
+).replace('/0/', '/{}/')
+
+SAMPLE_RECIPE_DEFAULTS = {
+    'title': 'Sample recipe',
+    'time_minutes': 10,
+    'price': 2
+}
 
 
 def image_upload_url(recipe_id):
     """Return url for recipe image upload"""
-    return reverse('recipe:recipe-upload-image', args=[recipe_id])
+    return RECIPE_UPLOAD_IMAGE_URL.format(recipe_id)
 
 
 def detail_url(recipe_id):
     """Return recipe detail"""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
-
-
-def sample_user(email='test@recipeapi.com', password='somethingrandom'):
-    """Creates a sample user"""
-    return get_user_model().objects.create_user(
-        email, password
-    )
+    return RECIPE_DETAIL_URL.format(recipe_id)
 
 
 def sample_tag(user, name='Main Course'):
@@ -45,21 +50,33 @@ def sample_ingredient(user, name='Cinnamon'):
 
 def sample_recipe(user, **params):
     """Create and return a sample recipe"""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 10,
-        'price': 2
-    }
+    defaults = SAMPLE_RECIPE_DEFAULTS.copy()
     defaults.update(params)
 
     return Recipe.objects.create(user=user, **defaults)
 
 
-class PublicRecipeApiTests(TestCase):
-    """Test unauthenticated recipe api access"""
+def sample_recipes(user, *titles):
+    """Create sample recipes with the given titles in a single query"""
+    return Recipe.objects.bulk_create([
+        Recipe(user=user, **{**SAMPLE_RECIPE_DEFAULTS, 'title': title})
+        for title in titles
+    ])
 
-    def setUp(self) -> None:
-        self.client = APIClient()
+
+def sample_image_bytes():
+    """Return the contents of a small JPEG image"""
+    buffer = io.BytesIO()
+    Image.new('RGB', (10, 10)).save(buffer, format='JPEG')
+
+    return buffer.getvalue()
+
+
+SAMPLE_IMAGE = sample_image_bytes()
+
+
+class PublicRecipeApiTests(APISimpleTestCase):
+    """Test unauthenticated recipe api access"""
 
     def test_login_required(self):
         """Test that login is required"""
@@ -68,25 +85,28 @@ class PublicRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateRecipeApiTests(TestCase):
+class PrivateRecipeApiTests(APITestCase):
     """Test authenticated recipe api access"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = sample_user()
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user()
+        cls.tag = sample_tag(user=cls.user)
+        cls.ingredient = sample_ingredient(user=cls.user)
 
+    def setUp(self) -> None:
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_recipes(self):
         """Test retrieving recipes"""
-        sample_recipe(self.user)
-        sample_recipe(self.user, title="Sample recipe 2")
+        sample_recipes(self.user, 'Sample recipe', 'Sample recipe 2')
 
         recipes = Recipe.objects.all().order_by('-id')
 
         serializer = RecipeSerializer(recipes, many=True)
 
-        res = self.client.get(RECIPES_URL)
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
@@ -112,16 +132,25 @@ class PrivateRecipeApiTests(TestCase):
         """Test viewing a recipe detail"""
         recipe = sample_recipe(user=self.user)
 
-        recipe.tags.add(sample_tag(user=self.user))
-        recipe.ingredients.add(sample_ingredient(user=self.user))
+        recipe.tags.add(self.tag)
+        recipe.ingredients.add(self.ingredient)
 
         url = detail_url(recipe.id)
 
-        res = self.client.get(url)
-
-        serializer = RecipeDetailSerializer(recipe)
+        with self.assertNumQueries(3):
+            res = self.client.get(url)
 
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, {
+            'id': recipe.id,
+            'title': 'Sample recipe',
+            'time_minutes': 10,
+            'price': '2.00',
+            'link': '',
+            'tags': [{'id': self.tag.id, 'name': 'Main Course'}],
+            'ingredients': [
+                {'id': self.ingredient.id, 'name': 'Cinnamon'}
+            ],
+        })
 
     def test_create_basic_recipe(self):
         """Test creating recipe"""
@@ -140,7 +169,7 @@ class PrivateRecipeApiTests(TestCase):
 
     def test_create_tags_recipe(self):
         """Test creating a recipe with tags"""
-        tag1 = sample_tag(user=self.user)
+        tag1 = self.tag
         tag2 = sample_tag(user=self.user, name='Vegan')
 
         payload = {
@@ -161,7 +190,7 @@ class PrivateRecipeApiTests(TestCase):
 
     def test_create_ingredients_recipe(self):
         """Test creating a recipe with ingredients"""
-        ingredient_1 = sample_ingredient(user=self.user)
+        ingredient_1 = self.ingredient
         ingredient_2 = sample_ingredient(user=self.user, name='Ginger')
 
         payload = {
@@ -183,7 +212,7 @@ class PrivateRecipeApiTests(TestCase):
     def test_update_partial_recipe(self):
         """Test updating recipe partially"""
         recipe = sample_recipe(user=self.user)
-        recipe.tags.add(sample_tag(user=self.user))
+        recipe.tags.add(self.tag)
 
         new_tag = sample_tag(user=self.user, name='Dessert')
 
@@ -193,7 +222,7 @@ class PrivateRecipeApiTests(TestCase):
 
         self.client.patch(url, payload)
 
-        recipe.refresh_from_db()
+        recipe = Recipe.objects.prefetch_related('tags').get(id=recipe.id)
         tags = recipe.tags.all()
 
         self.assertEqual(recipe.title, payload['title'])
@@ -203,7 +232,7 @@ class PrivateRecipeApiTests(TestCase):
     def test_update_full_recipe(self):
         """Test updating recipe fully"""
         recipe = sample_recipe(user=self.user)
-        recipe.tags.add(sample_tag(user=self.user))
+        recipe.tags.add(self.tag)
 
         payload = {
             'title': 'Spaghetti Carbonara',
@@ -214,7 +243,7 @@ class PrivateRecipeApiTests(TestCase):
 
         self.client.put(url, payload)
 
-        recipe.refresh_from_db()
+        recipe = Recipe.objects.prefetch_related('tags').get(id=recipe.id)
         tags = recipe.tags.all()
 
         for key in payload.keys():
@@ -224,61 +253,72 @@ class PrivateRecipeApiTests(TestCase):
 
     def test_filter_recipes_by_tags(self):
         """Test returning recipes with specific tags"""
-        recipe_tag_1 = sample_recipe(user=self.user)
-        recipe_tag_2 = sample_recipe(user=self.user, title='Samosa')
-        recipe_no_tag = sample_recipe(user=self.user, title='Rice')
+        sample_recipes(self.user, 'Sample recipe', 'Samosa', 'Rice')
+        recipe_tag_1, recipe_tag_2, recipe_no_tag = Recipe.objects.order_by(
+            'id'
+        )
 
-        tag_1 = sample_tag(user=self.user)
+        tag_1 = self.tag
         tag_2 = sample_tag(user=self.user, name='Fried')
 
-        recipe_tag_1.tags.add(tag_1)
-        recipe_tag_2.tags.add(tag_2)
+        Recipe.tags.through.objects.bulk_create([
+            Recipe.tags.through(recipe=recipe_tag_1, tag=tag_1),
+            Recipe.tags.through(recipe=recipe_tag_2, tag=tag_2)
+        ])
 
-        res = self.client.get(
-            RECIPES_URL,
-            {'tags': f'{tag_1.id},{tag_2.id}'}
-        )
+        with self.assertNumQueries(3):
+            res = self.client.get(
+                RECIPES_URL,
+                {'tags': f'{tag_1.id},{tag_2.id}'}
+            )
 
-        serializer_1 = RecipeSerializer(recipe_tag_1)
-        serializer_2 = RecipeSerializer(recipe_tag_2)
-        serializer_no = RecipeSerializer(recipe_no_tag)
+        serializer = RecipeSerializer(
+            [recipe_tag_1, recipe_tag_2, recipe_no_tag],
+            many=True
+        )
 
-        self.assertIn(serializer_1.data, res.data)
-        self.assertIn(serializer_2.data, res.data)
-        self.assertNotIn(serializer_no.data, res.data)
+        self.assertIn(serializer.data[0], res.data)
+        self.assertIn(serializer.data[1], res.data)
+        self.assertNotIn(serializer.data[2], res.data)
 
     def test_filter_recipes_by_ingredients(self):
         """Test filtering recipes by ingredients"""
-        recipe_ing_1 = sample_recipe(user=self.user)
-        recipe_ing_2 = sample_recipe(user=self.user, title='Chips')
-        recipe_ing_no = sample_recipe(user=self.user, title='Pizza')
+        sample_recipes(self.user, 'Sample recipe', 'Chips', 'Pizza')
+        recipe_ing_1, recipe_ing_2, recipe_ing_no = Recipe.objects.order_by(
+            'id'
+        )
 
-        ing_1 = sample_ingredient(user=self.user)
+        ing_1 = self.ingredient
         ing_2 = sample_ingredient(user=self.user, name='Potatoes')
 
-        recipe_ing_1.ingredients.add(ing_1)
-        recipe_ing_2.ingredients.add(ing_2)
+        Recipe.ingredients.through.objects.bulk_create([
+            Recipe.ingredients.through(recipe=recipe_ing_1, ingredient=ing_1),
+            Recipe.ingredients.through(recipe=recipe_ing_2, ingredient=ing_2)
+        ])
 
-        res = self.client.get(
-            RECIPES_URL,
-            {'ingredients': f'{ing_1.id},{ing_2.id}'}
+        with self.assertNumQueries(3):
+            res = self.client.get(
+                RECIPES_URL,
+                {'ingredients': f'{ing_1.id},{ing_2.id}'}
+            )
+
+        serializer = RecipeSerializer(
+            [recipe_ing_1, recipe_ing_2, recipe_ing_no],
+            many=True
         )
 
-        serializer_1 = RecipeSerializer(recipe_ing_1)
-        serializer_2 = RecipeSerializer(recipe_ing_2)
-        serializer_no = RecipeSerializer(recipe_ing_no)
+        self.assertIn(serializer.data[0], res.data)
+        self.assertIn(serializer.data[1], res.data)
+        self.assertNotIn(serializer.data[2], res.data)
 
-        self.assertIn(serializer_1.data, res.data)
-        self.assertIn(serializer_2.data, res.data)
-        self.assertNotIn(serializer_no.data, res.data)
 
+class RecipeImageUploadTests(APITestCase):
 
-class RecipeImageUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user()
 
     def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = sample_user()
-
         self.client.force_authenticate(user=self.user)
 
         self.recipe = sample_recipe(user=self.user)
@@ -290,12 +330,13 @@ class RecipeImageUploadTests(TestCase):
         """Test uploading an image to recipe"""
         url = image_upload_url(self.recipe.id)
 
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            img = Image.new('RGB', (10, 10))
-            img.save(ntf, format='JPEG')
-            ntf.seek(0)
+        image = SimpleUploadedFile(
+            'image.jpg',
+            SAMPLE_IMAGE,
+            content_type='image/jpeg'
+        )
 
-            res = self.client.post(url, {'image': ntf}, format='multipart')
+        res = self.client.post(url, {'image': image}, format='multipart')
 
         self.recipe.refresh_from_db()
 
@@ -1,28 +1,19 @@
-from django.test import TestCase
-from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase, APISimpleTestCase
 
 from core.models import Tag, Recipe
+from core.tests.helpers import sample_user
 
 from ..serializers import TagSerializer
 
 TAGS_URL = reverse('recipe:tag-list')
 
 
-def sample_user(email='test@recipeapi.com', password='somethingrandom'):
-    """Helper function to create a sample user"""
-    return get_user_model().objects.create_user(email=email, password=password)
-
-
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(APISimpleTestCase):
     """Test the public tags API"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-
     def test_login_required(self):
         """"Test that login is required for retreiving tags"""
         res = self.client.get(TAGS_URL)
@@ -30,21 +21,25 @@ class PublicTagsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateTagsApiTests(TestCase):
+class PrivateTagsApiTests(APITestCase):
     """Test the private tags API"""
 
-    def setUp(self) -> None:
-        self.user = sample_user()
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user()
 
-        self.client = APIClient()
+    def setUp(self) -> None:
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_tags(self):
         """Test retrieving tags"""
-        Tag.objects.create(user=self.user, name='Vegan')
-        Tag.objects.create(user=self.user, name='Dessert')
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert')
+        ])
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
         tags = Tag.objects.all().order_by('-name')
 
@@ -53,12 +48,23 @@ class PrivateTagsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
+    def test_list_serializer_matches_tag_serializer(self):
+        """Test that serializing a tag list matches serializing each tag"""
+        Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert')
+        ])
+
+        tags = Tag.objects.all().order_by('-name')
+
+        self.assertEqual(
+            TagSerializer(tags, many=True).data,
+            [TagSerializer(tag).data for tag in tags]
+        )
+
     def test_tags_limited_to_user(self):
         """Test that tags returned are for the authenticated user"""
-        user_test = sample_user(
-            email='test2@recipeapi.com',
-            password='somethingrandom2'
-        )
+        user_test = sample_user(email='test2@recipeapi.com')
 
         Tag.objects.create(user=user_test, name='user_test')
         tag = Tag.objects.create(user=self.user, name='user')
@@ -90,10 +96,11 @@ class PrivateTagsApiTests(TestCase):
 
         recipe.tags.add(tag_2)
 
-        res = self.client.get(
-            TAGS_URL,
-            {'assigned_only': 1}
-        )
+        with self.assertNumQueries(1):
+            res = self.client.get(
+                TAGS_URL,
+                {'assigned_only': 1}
+            )
 
         serializer_1 = TagSerializer(tag_1)
         serializer_2 = TagSerializer(tag_2)
@@ -1,8 +1,19 @@
 from rest_framework import serializers
+from rest_framework.utils.formatting import lazy_format
 
-from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth import get_user_model
+from django.core.validators import MinLengthValidator
 from django.utils.translation import ugettext_lazy as _
 
+User = get_user_model()
+
+PASSWORD_VALIDATORS = [
+    MinLengthValidator(5, message=lazy_format(
+        serializers.CharField.default_error_messages['min_length'],
+        min_length=5
+    )),
+]
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for user model"""
@@ -10,27 +21,30 @@ class UserSerializer(serializers.ModelSerializer):
         style={'input_type': 'password', },
         trim_whitespace=False,
         write_only=True,
-        min_length=5
+        validators=PASSWORD_VALIDATORS
     )
 
     class Meta:
-        model = get_user_model()
+        model = User
         fields = ('email', 'password')
 
     def create(self, validated_data):
         """Creates a new user and returns it"""
-        return get_user_model().objects.create_user(**validated_data)
+        return User.objects.create_user(**validated_data)
 
     def update(self, instance, validated_data):
         """Updates a user correctly"""
         password = validated_data.pop('password', None)
-        user = super().update(instance, validated_data)
+
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
 
         if password:
-            user.set_password(password)
-            user.save()
+            instance.set_password(password)
+
+        instance.save()
 
-        return user
+        return instance
 
 
 class AuthTokenSerializer(serializers.Serializer):
@@ -46,15 +60,16 @@ class AuthTokenSerializer(serializers.Serializer):
         email = attrs.get('email')
         password = attrs.get('password')
 
-        user = authenticate(
-            request=self.context.get('request'),
-            username=email,
-            password=password
-        )
+        user = User.objects.only('id', 'password', 'is_active').filter(
+            email=email
+        ).first()
 
-        if not user:
-            msg = _('Unable to authenticate with provided credentials')
-            raise serializers.ValidationError(msg, code='authentication')
+        if user is None:
+            # Hash anyway so response time does not reveal unknown emails
+            User().set_password(password)
+        elif user.check_password(password) and user.is_active:
+            attrs['user'] = user
+            return attrs
 
-        attrs['user'] = user
-        return attrs
+        msg = _('Unable to authenticate with provided credentials')
+        raise serializers.ValidationError(msg, code='authentication')
@@ -1,26 +1,27 @@
-from django.test import TestCase
+from unittest.mock import patch
 
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase
+
+from core.tests.helpers import sample_user
 
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
+User = get_user_model()
+
 
 def create_user(**params):
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
-class PublicUserApiTests(TestCase):
+class PublicUserApiTests(APITestCase):
     """Test the users API (public)"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-
     def test_create_user_valid(self):
         """Test for creating a valid user successfully"""
         payload = {
@@ -32,7 +33,7 @@ class PublicUserApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
-        user = get_user_model().objects.get(**res.data)
+        user = User.objects.get(**res.data)
         self.assertTrue(user.check_password(payload['password']))
         self.assertNotIn('password', res.data)
 
@@ -42,7 +43,7 @@ class PublicUserApiTests(TestCase):
             'email': 'test@recipeapi.com',
             'password': 'somethingrandom'
         }
-        create_user(**payload)
+        sample_user(email=payload['email'])
 
         res = self.client.post(CREATE_USER_URL, payload)
 
@@ -55,15 +56,12 @@ class PublicUserApiTests(TestCase):
             'password': 'sr'
         }
 
-        res = self.client.post(CREATE_USER_URL, payload)
+        # Only the email uniqueness check runs, nothing is inserted
+        with self.assertNumQueries(1):
+            res = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
-        user_exists = get_user_model().objects.filter(
-            email=payload['email']
-        ).exists()
-        self.assertFalse(user_exists)
-
     def test_token_valid_user(self):
         """Test that token is created if user is valid"""
         payload = {
@@ -100,14 +98,32 @@ class PublicUserApiTests(TestCase):
             'password': 'somethingrandom'
         }
 
-        res = self.client.post(TOKEN_URL, payload)
+        with patch.object(User, 'set_password') as set_password:
+            res = self.client.post(TOKEN_URL, payload)
 
+        set_password.assert_called_once_with(payload['password'])
+        self.assertNotIn('token', res.data)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_token_inactive_user(self):
+        """Test that token is not created if user is inactive"""
+        payload = {
+            'email': 'test@recipeapi.com',
+            'password': 'somethingrandom'
+        }
+        create_user(**payload, is_active=False)
+
+        with patch.object(User, 'check_password') as check_password:
+            check_password.return_value = True
+            res = self.client.post(TOKEN_URL, payload)
+
+        check_password.assert_called_once_with(payload['password'])
         self.assertNotIn('token', res.data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_token_invalid_fields(self):
         """Test that token is not created if payload fields are invalid"""
-        create_user(email='test@recipeapi.com', password='somethingrandom')
+        sample_user(email='test@recipeapi.com')
         payload = {
             'email': 'test@recipeapi.com',
         }
@@ -119,20 +135,20 @@ class PublicUserApiTests(TestCase):
 
     def test_retrieve_user_unauthenticated(self):
         """Test that authentication is required for users"""
-        res = self.client.get(ME_URL)
+        with self.assertNumQueries(0):
+            res = self.client.get(ME_URL)
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateUserApiTests(TestCase):
+class PrivateUserApiTests(APITestCase):
     """Test API requests that require authentication"""
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = sample_user(email='test@recipeapi.com')
+
     def setUp(self) -> None:
-        self.user = create_user(
-            email='test@recipeapi.com',
-            password='somethingrandom'
-        )
-        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_user_authenticated(self):
@@ -154,9 +170,15 @@ class PrivateUserApiTests(TestCase):
         """Test that user can update profile"""
         payload = {'password': 'somethingnewpassword'}
 
-        res = self.client.patch(ME_URL, payload)
+        # Update a copy so the class level user is left unchanged
+        user = User.objects.get(pk=self.user.pk)
+        self.client.force_authenticate(user=user)
 
-        self.user.refresh_from_db()
+        with self.assertNumQueries(1):
+            res = self.client.patch(ME_URL, payload)
+
+        user.refresh_from_db()
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertTrue(self.user.check_password(payload['password']))
+        self.assertTrue(user.check_password(payload['password']))
+        self.assertFalse(self.user.check_password(payload['password']))